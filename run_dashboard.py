@@ -1,48 +1,83 @@
 """
 News dashboard: web UI to view scraped articles from Supabase.
 Run: python run_dashboard.py  →  http://127.0.0.1:5000
+Served by waitress; set DASHBOARD_DEBUG=1 for the Flask dev server with reloader.
 """
 import os
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, render_template, request, abort
+from flask import Flask, render_template, request, abort, g
+from flask_caching import Cache
+from src.config import DASHBOARD_DEBUG, DASHBOARD_HOST, DASHBOARD_PORT, DASHBOARD_THREADS
 from src.db.article_repository import ArticleRepository
 
 app = Flask(__name__)
+# In-process response cache: the data only changes when the daily job runs,
+# so short TTLs spare Supabase a round-trip on most page loads.
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60})
 
 # Fixed tab order: All (no filter), then News, Sport, Business, Technology, Health, Pharma
 TAB_OPTIONS = ["All", "News", "Sport", "Business", "Technology", "Health", "Pharma"]
 
 
-def _time_ago(dt_str: str | None) -> str:
-    if not dt_str:
-        return ""
+@lru_cache(maxsize=8192)
+def _parse_dt(dt_str: str) -> datetime | None:
+    """Parse an ISO timestamp (UTC if naive); None if unparseable. Cached: timestamps repeat across renders."""
     try:
         dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        delta = now - dt
-        mins = int(delta.total_seconds() / 60)
-        if mins < 1:
-            return "Just now"
-        if mins < 60:
-            return f"{mins} min ago"
-        hrs = mins // 60
-        if hrs == 1:
-            return "1 hr ago"
-        if hrs < 24:
-            return f"{hrs} hrs ago"
-        days = hrs // 24
-        return "1 day ago" if days == 1 else f"{days} days ago"
-    except Exception:
-        return dt_str[:10] if dt_str else ""
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _time_ago(dt_str: str | None, now: datetime | None = None) -> str:
+    if not dt_str:
+        return ""
+    dt = _parse_dt(dt_str)
+    if dt is None:
+        return dt_str[:10]
+    now = now or datetime.now(timezone.utc)
+    mins = int((now - dt).total_seconds() / 60)
+    if mins < 1:
+        return "Just now"
+    if mins < 60:
+        return f"{mins} min ago"
+    hrs = mins // 60
+    if hrs == 1:
+        return "1 hr ago"
+    if hrs < 24:
+        return f"{hrs} hrs ago"
+    days = hrs // 24
+    return "1 day ago" if days == 1 else f"{days} days ago"
+
+
+def _enrich(a: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """Add the derived listing fields (time_ago, display_summary) to an article row."""
+    a["time_ago"] = _time_ago(a.get("published_at") or a.get("created_at"), now)
+    summary = (a.get("summary") or "").strip()
+    if summary:
+        a["display_summary"] = summary
+    else:
+        preview = (a.get("content_preview") or "").strip()
+        if preview:
+            a["display_summary"] = (preview[:300] + "…") if len(preview) > 300 else preview
+        else:
+            a["display_summary"] = "Open the article to read more."
+    return a
+
+
+def _cacheable_listing(response: Any) -> bool:
+    """Cache the listing only if articles loaded; an empty page may be a Supabase failure."""
+    return not g.get("listing_empty", False)
 
 
 @app.route("/")
+@cache.cached(timeout=60, query_string=True, response_filter=_cacheable_listing)
 def index():
     category_param = (request.args.get("category") or "").strip() or None
     # "All" as explicit param same as no filter
@@ -50,22 +85,18 @@ def index():
         category_param = None
     try:
         repo = ArticleRepository()
-        articles = repo.get_articles(
-            limit=100, order_by="published_at", desc=True, category=category_param
-        )
-        for a in articles:
-            a["time_ago"] = _time_ago(a.get("published_at") or a.get("created_at"))
-            summary = (a.get("summary") or "").strip()
-            full = (a.get("full_content") or "").strip()
-            if summary:
-                a["display_summary"] = summary
-            elif full:
-                a["display_summary"] = (full[:300] + "…") if len(full) > 300 else full
-            else:
-                a["display_summary"] = "Open the article to read more."
+        now = datetime.now(timezone.utc)
+        articles = [
+            _enrich(a, now)
+            for a in repo.get_articles(
+                limit=100, order_by="published_at", desc=True, category=category_param
+            )
+        ]
     except Exception as e:
         articles = []
         app.logger.exception("Failed to load: %s", e)
+    # The repository returns [] when the query fails; don't serve that for the cache TTL after recovery
+    g.listing_empty = not articles
     return render_template(
         "dashboard.html",
         articles=articles,
@@ -75,6 +106,7 @@ def index():
 
 
 @app.route("/article/<article_id>")
+@cache.memoize(timeout=300)
 def article_detail(article_id: str):
     """Detail view: show full article on our site; title links to original URL."""
     repo = ArticleRepository()
@@ -93,4 +125,10 @@ def article_detail(article_id: str):
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    if DASHBOARD_DEBUG:
+        # Werkzeug dev server: reloader + tracebacks, single process
+        app.run(host=DASHBOARD_HOST, port=DASHBOARD_PORT, debug=True)
+    else:
+        from waitress import serve
+
+        serve(app, host=DASHBOARD_HOST, port=DASHBOARD_PORT, threads=DASHBOARD_THREADS)
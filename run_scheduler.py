@@ -34,8 +34,12 @@ def main() -> None:
     # Run once on start (optional)
     job()
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        # Sleep straight to the next due run (capped so clock changes are picked up hourly)
+        idle = schedule.idle_seconds()
+        if idle is not None and idle <= 0:
+            schedule.run_pending()
+        else:
+            time.sleep(max(1, min(idle or 60, 3600)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,4 @@
+-- Index content_hash so the daily job can look up summaries of already-seen content.
+-- Run in Supabase SQL Editor.
+
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
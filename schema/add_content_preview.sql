@@ -0,0 +1,5 @@
+-- Short preview of full_content for the dashboard listing, so it does not download whole articles.
+-- Run in Supabase SQL Editor.
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS content_preview TEXT
+    GENERATED ALWAYS AS (left(full_content, 400)) STORED;
@@ -0,0 +1,5 @@
+-- HTTP cache validators for RSS feeds, so unchanged feeds answer 304 Not Modified.
+-- Run in Supabase SQL Editor.
+
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS etag TEXT;
+ALTER TABLE sources ADD COLUMN IF NOT EXISTS last_modified TEXT;
@@ -0,0 +1,11 @@
+-- Track OpenAI Batch API submissions for offline summarization (SUMMARY_MODE=batch).
+-- Run in Supabase SQL Editor.
+
+CREATE TABLE IF NOT EXISTS summary_batches (
+    batch_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_summary_batches_status ON summary_batches(status);
@@ -1,3 +1,4 @@
-from .summarize import summarize_with_openai
+from .summarize import summarize_with_openai, summarize_many
+from .batch_summarize import submit_summary_batch, fetch_summary_batch
 
-__all__ = ["summarize_with_openai"]
+__all__ = ["summarize_with_openai", "summarize_many", "submit_summary_batch", "fetch_summary_batch"]
@@ -0,0 +1,108 @@
+"""
+Offline summarization through the OpenAI Batch API.
+Requests are submitted as one JSONL file and completed within 24h at half the
+per-token price, so the daily job can store articles first and summarize later.
+"""
+import json
+import logging
+from typing import Any, Optional
+
+from src.ai.summarize import (
+    SUMMARY_MAX_TOKENS,
+    SYSTEM_PROMPT,
+    _build_prompt,
+    _limit_words,
+    _openai_client,
+    _truncate,
+)
+from src.config import OPENAI_API_KEY
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch states after which no more output will appear
+FINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _batch_request_line(article: dict[str, Any], model: str) -> str:
+    """One JSONL request line; custom_id carries the article id back with the result."""
+    prompt = _build_prompt(article.get("title") or "Untitled", _truncate((article.get("full_content") or "").strip()))
+    return json.dumps({
+        "custom_id": str(article["id"]),
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": SUMMARY_MAX_TOKENS,
+            "temperature": 0.2,
+        },
+    })
+
+
+def submit_summary_batch(articles: list[dict[str, Any]], model: str = "gpt-4o-mini") -> Optional[str]:
+    """
+    Submit summarization requests for articles (id, title, full_content) as one batch.
+    Returns the batch id, or None if nothing was submitted.
+    """
+    if not OPENAI_API_KEY:
+        logger.warning("OPENAI_API_KEY not set; the Batch API is OpenAI-only")
+        return None
+    lines = [
+        _batch_request_line(a, model)
+        for a in articles
+        if len((a.get("full_content") or "").strip()) >= 100
+    ]
+    if not lines:
+        return None
+    try:
+        client = _openai_client()
+        batch_file = client.files.create(
+            file=("summaries.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        logger.info("Submitted summary batch %s with %d articles", batch.id, len(lines))
+        return batch.id
+    except Exception as e:
+        logger.exception("Submitting summary batch failed: %s", e)
+        return None
+
+
+def fetch_summary_batch(batch_id: str) -> tuple[Optional[str], dict[str, str]]:
+    """
+    Check a submitted batch. Returns (status, {article_id: summary}); the mapping is
+    only filled once the batch has completed. Status is None if the lookup failed.
+    """
+    try:
+        client = _openai_client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            return batch.status, {}
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        logger.exception("Fetching summary batch %s failed: %s", batch_id, e)
+        return None, {}
+
+    summaries: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            body = (item.get("response") or {}).get("body") or {}
+            text = (body["choices"][0]["message"]["content"] or "").strip()
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.debug("Skipping unreadable batch output line: %s", e)
+            continue
+        if text:
+            summaries[item["custom_id"]] = _limit_words(text)
+    return batch.status, summaries
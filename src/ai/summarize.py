@@ -2,23 +2,47 @@
 AI summarization using OpenAI API.
 Produces neutral, factual summaries (3–5 bullet points or short paragraph).
 """
+import json
 import logging
-from typing import Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
 
 from openai import OpenAI
 from groq import Groq
 
-from src.config import OPENAI_API_KEY, GROQ_API_KEY, GROQ_MODEL
+from src.config import OPENAI_API_KEY, GROQ_API_KEY, GROQ_MODEL, SUMMARIZE_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
 # Truncate very long content to stay within token limits and reduce cost
 MAX_CONTENT_CHARS = 12000
 
+# Batched summarization: articles per request and per-article content cap
+BATCH_SIZE = 8
+BATCH_CONTENT_CHARS = 1500
+
+SUMMARY_MAX_WORDS = 60
+# Single summaries are streamed and cut off here; ~60 words fit well inside SUMMARY_MAX_TOKENS
+SUMMARY_STREAM_STOP_WORDS = 70
+SUMMARY_MAX_TOKENS = 120
+
+# Retries on Groq 429 responses before giving up
+GROQ_MAX_RETRIES = 3
+
 SYSTEM_PROMPT = """You are a factual summarization assistant. Given a news article, produce a concise, neutral summary.
 Write a single paragraph that is around 60 words (roughly 50–70 words). Be strictly factual; do not add opinion or speculation."""
 
-USER_PROMPT_TEMPLATE = """Summarize this news article in a neutral, factual way as a single paragraph of about 60 words (roughly 50–70 words). Do not exceed 80 words:
+BATCH_SYSTEM_PROMPT = """You are a factual summarization assistant. Given several numbered news articles, produce a concise, neutral summary of each.
+Each summary is a single paragraph of around 60 words (roughly 50–70 words). Be strictly factual; do not add opinion or speculation.
+Respond with JSON only, in the form {"summaries": ["...", "..."]}, where item i is the summary of article i."""
+
+
+# Prompt builders are f-strings (compiled once) rather than str.format templates parsed per call
+def _build_prompt(title: str, content: str) -> str:
+    return f"""Summarize this news article in a neutral, factual way as a single paragraph of about 60 words (roughly 50–70 words). Do not exceed 80 words:
 
 Title: {title}
 
@@ -26,12 +50,119 @@ Content:
 {content}"""
 
 
+def _build_batch_article(index: int, title: str, content: str) -> str:
+    return f"""Article {index}
+Title: {title}
+
+Content:
+{content}"""
+
+
+@lru_cache(maxsize=1)
+def _groq_client() -> Groq:
+    """Single Groq client per process so its HTTP connection pool is reused."""
+    return Groq(api_key=GROQ_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> OpenAI:
+    """Single OpenAI client per process so its HTTP connection pool is reused."""
+    return OpenAI(api_key=OPENAI_API_KEY)
+
+
 def _truncate(text: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
     if not text or len(text) <= max_chars:
         return text or ""
     return text[:max_chars].rsplit(maxsplit=1)[0] + "…"
 
 
+def _limit_words(summary: str) -> str:
+    """Hard-limit to ~60 words in case the model goes over."""
+    words = summary.split()
+    if len(words) > SUMMARY_MAX_WORDS:
+        summary = " ".join(words[:SUMMARY_MAX_WORDS]).rstrip(" .,!?:;") + "..."
+    return summary
+
+
+def _read_stream(stream: Any, max_words: int) -> str:
+    """Accumulate streamed deltas, stopping as soon as the reply reaches max_words."""
+    parts: list[str] = []
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            parts.append(delta)
+            # A word can only be completed when whitespace arrives
+            if any(c.isspace() for c in delta) and len("".join(parts).split()) >= max_words:
+                break
+    finally:
+        # Release the connection back to the pool even when we stop early
+        stream.close()
+    return "".join(parts).strip()
+
+
+def _complete(
+    messages: list[dict[str, str]],
+    model: str,
+    max_tokens: int = 500,
+    json_mode: bool = False,
+    stream_max_words: Optional[int] = None,
+) -> Optional[str]:
+    """
+    Run one chat completion with Groq (preferred) or OpenAI.
+    With stream_max_words, the reply is streamed and generation is cut off at that many words.
+    Returns the reply text, or None on failure or when no API key is set.
+    """
+    extra: dict[str, Any] = {"response_format": {"type": "json_object"}} if json_mode else {}
+    if stream_max_words:
+        extra["stream"] = True
+
+    def reply_text(response: Any) -> str:
+        if stream_max_words:
+            return _read_stream(response, stream_max_words)
+        return (response.choices[0].message.content or "").strip()
+
+    # Prefer Groq if key is configured; otherwise fall back to OpenAI.
+    if GROQ_API_KEY:
+        for attempt in range(GROQ_MAX_RETRIES + 1):
+            try:
+                response = _groq_client().chat.completions.create(
+                    model=GROQ_MODEL,
+                    messages=messages,
+                    temperature=0.2,
+                    max_tokens=max_tokens,
+                    **extra,
+                )
+                return reply_text(response)
+            except Exception as e:
+                # Retry rate limits (429 / "Too Many Requests") with exponential backoff
+                error_msg = str(e)
+                if attempt < GROQ_MAX_RETRIES and ("429" in error_msg or "Too Many Requests" in error_msg):
+                    delay = (2 ** attempt) + random.uniform(0, 1)
+                    logger.warning("Groq Rate Limit (429). Retrying in %.2fs...", delay)
+                    time.sleep(delay)
+                    continue
+                logger.exception("Groq summarization failed: %s", e)
+                return None
+
+    if not OPENAI_API_KEY:
+        logger.warning("No GROQ_API_KEY or OPENAI_API_KEY set; skipping summarization")
+        return None
+    try:
+        response = _openai_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.2,
+            **extra,
+        )
+        return reply_text(response)
+    except Exception as e:
+        logger.exception("OpenAI summarization failed: %s", e)
+        return None
+
+
 def summarize_with_openai(
     title: str,
     full_content: Optional[str],
@@ -47,74 +178,88 @@ def summarize_with_openai(
         return None
 
     content = _truncate(content)
-    prompt = USER_PROMPT_TEMPLATE.format(title=title or "Untitled", content=content)
-
-    # Prefer Groq if key is configured; otherwise fall back to OpenAI.
-    # Groq
-    if GROQ_API_KEY:
-        try:
-            # Simple retry loop for 429 errors
-            max_retries = 3
-            last_exception = None
-            import time
-            import random
-
-            for i in range(max_retries + 1):
-                try:
-                    client = Groq(api_key=GROQ_API_KEY)
-                    response = client.chat.completions.create(
-                        model=GROQ_MODEL,
-                        messages=[
-                            {"role": "system", "content": SYSTEM_PROMPT},
-                            {"role": "user", "content": prompt},
-                        ],
-                        temperature=0.2,
-                        max_tokens=500,
-                    )
-                    summary = (response.choices[0].message.content or "").strip()
-                    break
-                except Exception as e:
-                    # Check if error message contains 429 or "Too Many Requests"
-                    error_msg = str(e)
-                    if "429" in error_msg or "Too Many Requests" in error_msg:
-                        if i < max_retries:
-                            delay = (2 ** i) + random.uniform(0, 1)
-                            logger.warning("Groq Rate Limit (429). Retrying in %.2fs...", delay)
-                            time.sleep(delay)
-                            continue
-                    last_exception = e
-                    raise e
-            if not summary and last_exception:
-               raise last_exception
-
-        except Exception as e:
-            logger.exception("Groq summarization failed: %s", e)
-            summary = ""
-    else:
-        if not OPENAI_API_KEY:
-            logger.warning("No GROQ_API_KEY or OPENAI_API_KEY set; skipping summarization")
-            return None
-        try:
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.2,
-            )
-            summary = (response.choices[0].message.content or "").strip()
-        except Exception as e:
-            logger.exception("OpenAI summarization failed: %s", e)
-            summary = ""
+    prompt = _build_prompt(title or "Untitled", content)
 
+    summary = _complete(
+        [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        model=model,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        stream_max_words=SUMMARY_STREAM_STOP_WORDS,
+    )
     if not summary:
         return None
+    return _limit_words(summary)
 
-    # Hard-limit to ~60 words in case the model goes over.
-    words = summary.split()
-    if len(words) > 60:
-        summary = " ".join(words[:60]).rstrip(" .,!?:;") + "..."
-    return summary
+
+def _summarize_chunk(
+    chunk: list[tuple[str, str]],
+    model: str,
+) -> list[Optional[str]]:
+    """Summarize up to BATCH_SIZE articles in one JSON-mode request."""
+    prompt = "\n\n".join(
+        _build_batch_article(i + 1, title or "Untitled", _truncate(content, BATCH_CONTENT_CHARS))
+        for i, (title, content) in enumerate(chunk)
+    )
+    reply = _complete(
+        [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        model=model,
+        max_tokens=150 * len(chunk),
+        json_mode=True,
+    )
+    if reply is None:
+        # The API call itself failed; per-article calls to the same backend would fail too
+        return [None] * len(chunk)
+
+    summaries = None
+    try:
+        summaries = json.loads(reply).get("summaries")
+    except (ValueError, AttributeError) as e:
+        logger.warning("Could not parse batched summaries: %s", e)
+
+    if not isinstance(summaries, list) or len(summaries) != len(chunk):
+        # Model ignored the requested shape; summarize this chunk one by one.
+        logger.warning("Batched summary response malformed; falling back to per-article calls")
+        return [summarize_with_openai(title, content, model=model) for title, content in chunk]
+
+    results: list[Optional[str]] = []
+    for summary in summaries:
+        summary = (summary if isinstance(summary, str) else "").strip()
+        results.append(_limit_words(summary) if summary else None)
+    return results
+
+
+def summarize_many(
+    items: list[tuple[str, Optional[str]]],
+    model: str = "gpt-4o-mini",
+) -> list[Optional[str]]:
+    """
+    Summarize many (title, full_content) pairs, BATCH_SIZE articles per LLM call.
+    Up to SUMMARIZE_CONCURRENCY calls run concurrently (the work is network-bound).
+    Returns a list aligned with `items`; None where content is too short or the call failed.
+    """
+    results: list[Optional[str]] = [None] * len(items)
+    pending: list[tuple[int, str, str]] = []
+    for i, (title, full_content) in enumerate(items):
+        content = (full_content or "").strip()
+        if len(content) < 100:
+            continue
+        pending.append((i, title, content))
+
+    chunks = [pending[start:start + BATCH_SIZE] for start in range(0, len(pending), BATCH_SIZE)]
+    if not chunks:
+        return results
+
+    def run(chunk: list[tuple[int, str, str]]) -> list[Optional[str]]:
+        return _summarize_chunk([(title, content) for _, title, content in chunk], model)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(SUMMARIZE_CONCURRENCY, len(chunks)))) as ex:
+        for chunk, summaries in zip(chunks, ex.map(run, chunks)):
+            for (i, _, _), summary in zip(chunk, summaries):
+                results[i] = summary
+    return results
@@ -22,7 +22,29 @@ def get_env(key: str, default: str | None = None) -> str | None:
 _raw_url = (get_env("SUPABASE_URL", "") or "").strip().replace("\r", "")
 SUPABASE_URL = _raw_url.rstrip("/") if _raw_url else ""
 _raw_key = (get_env("SUPABASE_SERVICE_KEY", "") or "").strip().replace("\r", "")
-SUPABASE_SERVICE_KEY = _raw_key
+
+
+def _validate_supabase_key(key: str) -> str:
+    """Reject placeholder or non-secret keys once at import; a missing key is reported by the client."""
+    if not key:
+        return key
+    # Catch placeholder or obviously wrong key
+    if "your-service-role-key" in key.lower() or len(key) < 40:
+        raise ValueError(
+            "SUPABASE_SERVICE_KEY looks invalid. Use the service_role (Legacy tab) or "
+            "a Secret key from Supabase Dashboard → Project → Settings → API Keys."
+        )
+    # Accept both: legacy JWT (eyJ...) and new secret key (sb_secret_...)
+    if not key.startswith(("eyJ", "sb_secret_")):
+        raise ValueError(
+            "SUPABASE_SERVICE_KEY should be either: (1) Legacy service_role JWT (starts with eyJ) "
+            "from tab 'Legacy anon, service_role API keys', or (2) new Secret key (starts with sb_secret_). "
+            "Do not use the publishable/anon key."
+        )
+    return key
+
+
+SUPABASE_SERVICE_KEY = _validate_supabase_key(_raw_key)
 
 # OpenAI
 OPENAI_API_KEY = get_env("OPENAI_API_KEY", "")
@@ -31,14 +53,34 @@ OPENAI_API_KEY = get_env("OPENAI_API_KEY", "")
 GROQ_API_KEY = get_env("GROQ_API_KEY", "")
 GROQ_MODEL = get_env("GROQ_MODEL", "llama-3.1-8b-instant")
 
+# "inline": summarize during the daily job; "batch": store articles unsummarized and
+# summarize them later through the OpenAI Batch API (run_summary_batch_job)
+SUMMARY_MODE = (get_env("SUMMARY_MODE", "inline") or "inline").lower()
+
+# Max summarization requests in flight at once
+SUMMARIZE_CONCURRENCY = int(get_env("SUMMARIZE_CONCURRENCY", "10"))
+
 # Scheduler
 DAILY_RUN_HOUR = int(get_env("DAILY_RUN_HOUR", "9"))
 DAILY_RUN_MINUTE = int(get_env("DAILY_RUN_MINUTE", "0"))
 
 # Scraper
 SCRAPER_DELAY_SECONDS = float(get_env("SCRAPER_DELAY_SECONDS", "2"))
+# Article pages fetched concurrently by the daily job
+SCRAPER_MAX_WORKERS = int(get_env("SCRAPER_MAX_WORKERS", "16"))
+# BBC cards showing a date and a description at least this long are summarized from it without fetching the page (0 = always fetch)
+BBC_EXCERPT_MIN_CHARS = int(get_env("BBC_EXCERPT_MIN_CHARS", "400"))
+# Processes for parsing/extracting article HTML off the scraper threads (0 = parse in-thread)
+SCRAPER_PARSE_PROCESSES = int(get_env("SCRAPER_PARSE_PROCESSES", "0"))
+# SQLite file for caching fetched article pages for 24h (requests-cache); empty = no cache
+SCRAPER_CACHE_PATH = get_env("SCRAPER_CACHE_PATH", "") or ""
+
+# Dashboard
+DASHBOARD_HOST = get_env("DASHBOARD_HOST", "0.0.0.0")
+DASHBOARD_PORT = int(get_env("DASHBOARD_PORT", "5000"))
+DASHBOARD_THREADS = int(get_env("DASHBOARD_THREADS", "8"))
+DASHBOARD_DEBUG = (get_env("DASHBOARD_DEBUG", "") or "").lower() in ("1", "true", "yes")
 
-# Logging
 # Logging
 LOG_LEVEL = get_env("LOG_LEVEL", "INFO")
 
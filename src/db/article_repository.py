@@ -2,12 +2,19 @@
 Article and source repository: insert/upsert and fetch for dashboard.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from src.db.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Max values per PostgREST `in.(...)` filter; the filter travels in the GET query string, so keep it short
+IN_FILTER_CHUNK = 200
+# Summary PATCH requests in flight at once in update_summaries
+SUMMARY_UPDATE_CONCURRENCY = 8
+
 
 def _row_to_article(row: dict[str, Any]) -> dict[str, Any]:
     return {
@@ -24,6 +31,39 @@ def _row_to_article(row: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _tab_categories(category: str) -> list[str]:
+    """Source categories shown under a dashboard tab."""
+    # "News" tab shows general news: sources with category News, General, or World
+    if category.strip().lower() == "news":
+        return ["News", "General", "World"]
+    return [category.strip()]
+
+
+def _article_payload(
+    *,
+    source_id: Optional[str],
+    source_name: str,
+    title: str,
+    article_url: str,
+    full_content: Optional[str],
+    summary: Optional[str],
+    published_at: Optional[str],
+    content_hash: str,
+    image_url: Optional[str] = None,
+) -> dict[str, Any]:
+    return {
+        "source_id": source_id,
+        "source_name": source_name,
+        "title": title,
+        "article_url": article_url,
+        "full_content": full_content or "",
+        "summary": summary or "",
+        "published_at": published_at,
+        "content_hash": content_hash,
+        "image_url": image_url or "",
+    }
+
+
 class ArticleRepository:
     def __init__(self):
         self.client = get_supabase_client()
@@ -41,17 +81,17 @@ class ArticleRepository:
         content_hash: str,
         image_url: Optional[str] = None,
     ) -> dict[str, Any] | None:
-        payload = {
-            "source_id": source_id,
-            "source_name": source_name,
-            "title": title,
-            "article_url": article_url,
-            "full_content": full_content or "",
-            "summary": summary or "",
-            "published_at": published_at,
-            "content_hash": content_hash,
-            "image_url": image_url or "",
-        }
+        payload = _article_payload(
+            source_id=source_id,
+            source_name=source_name,
+            title=title,
+            article_url=article_url,
+            full_content=full_content,
+            summary=summary,
+            published_at=published_at,
+            content_hash=content_hash,
+            image_url=image_url,
+        )
         try:
             result = (
                 self.client.table("articles")
@@ -65,6 +105,27 @@ class ArticleRepository:
             logger.exception("Upsert article failed: %s", e)
             return None
 
+    def upsert_articles_bulk(self, articles: list[dict[str, Any]]) -> int:
+        """
+        Upsert many articles in a single request (same fields as upsert_article).
+        Falls back to per-row upserts if the bulk request fails. Returns the number of rows written.
+        """
+        # Postgres rejects one statement touching the same conflict key twice; last one wins.
+        payloads = {a["article_url"]: _article_payload(**a) for a in articles}
+        if not payloads:
+            return 0
+        try:
+            result = (
+                self.client.table("articles")
+                .upsert(list(payloads.values()), on_conflict="article_url", ignore_duplicates=False)
+                .execute()
+            )
+            return len(result.data or [])
+        except Exception as e:
+            # One bad row fails the whole statement; retry row by row to isolate it
+            logger.warning("Bulk upsert of %d articles failed, retrying per row: %s", len(payloads), e)
+            return sum(1 for a in payloads.values() if self.upsert_article(**a) is not None)
+
     def get_sources(self, active_only: bool = True) -> list[dict[str, Any]]:
         try:
             q = self.client.table("sources").select("*")
@@ -76,6 +137,15 @@ class ArticleRepository:
             logger.exception("Get sources failed: %s", e)
             return []
 
+    def update_feed_validators(self, source_id: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a feed's ETag/Last-Modified for the next conditional GET (schema/add_feed_validators.sql)."""
+        try:
+            self.client.table("sources").update(
+                {"etag": etag, "last_modified": last_modified}
+            ).eq("id", source_id).execute()
+        except Exception as e:
+            logger.warning("Update feed validators for source %s failed: %s", source_id, e)
+
     def get_categories(self) -> list[str]:
         try:
             sources = self.get_sources(active_only=True)
@@ -87,13 +157,13 @@ class ArticleRepository:
 
     def get_source_names_by_category(self, category: str) -> list[str]:
         try:
-            q = self.client.table("sources").select("name").eq("is_active", True)
-            # "News" tab shows general news: sources with category News, General, or World
-            if category.strip().lower() == "news":
-                q = q.in_("category", ["News", "General", "World"])
-            else:
-                q = q.eq("category", category.strip())
-            result = q.execute()
+            result = (
+                self.client.table("sources")
+                .select("name")
+                .eq("is_active", True)
+                .in_("category", _tab_categories(category))
+                .execute()
+            )
             return [r["name"] for r in (result.data or []) if r.get("name")]
         except Exception as e:
             logger.exception("Get source names by category failed: %s", e)
@@ -108,37 +178,76 @@ class ArticleRepository:
     ) -> list[dict[str, Any]]:
         try:
             col = "published_at" if order_by == "published_at" else "created_at"
-            q = (
-                self.client.table("articles")
-                .select("id, title, summary, full_content, source_name, article_url, published_at, created_at, image_url")
-                .order(col, desc=desc)
-                .limit(limit)
-            )
-            if category and category.strip() and category.strip().lower() != "all":
-                source_names = self.get_source_names_by_category(category.strip())
-                if not source_names:
-                    return []
-                q = q.in_("source_name", source_names)
-            result = q.execute()
-            return [dict(row) for row in (result.data or [])]
+            # Listing only needs a short preview of full_content (see schema/add_content_preview.sql)
+            columns = "id, title, summary, content_preview, source_name, article_url, published_at, created_at, image_url"
+            filter_category = category and category.strip() and category.strip().lower() != "all"
+            if filter_category:
+                # Inner-join sources so the category filter runs server-side in the same request
+                columns += ", sources!inner(category, is_active)"
+            q = self.client.table("articles").select(columns)
+            if filter_category:
+                q = q.eq("sources.is_active", True).in_("sources.category", _tab_categories(category))
+            result = q.order(col, desc=desc).limit(limit).execute()
+            # postgrest already returns fresh dicts per call; callers may mutate them in place
+            return result.data or []
         except Exception as e:
             logger.exception("Get articles failed: %s", e)
             return []
 
     def article_exists_by_url(self, article_url: str) -> bool:
         try:
+            # HEAD request: PostgREST returns only the count header, no row body
             result = (
                 self.client.table("articles")
-                .select("id")
+                .select("id", count="exact", head=True)
                 .eq("article_url", article_url)
-                .limit(1)
                 .execute()
             )
-            return bool(result.data and len(result.data) > 0)
+            return (result.count or 0) > 0
         except Exception as e:
             logger.warning("article_exists_by_url failed: %s", e)
             return False
 
+    def existing_urls(self, urls: list[str]) -> set[str]:
+        """Return the subset of `urls` already stored, using one query per IN_FILTER_CHUNK URLs."""
+        found: set[str] = set()
+        # Feeds repeat links across sections; only ask about each URL once
+        urls = list(dict.fromkeys(urls))
+        for start in range(0, len(urls), IN_FILTER_CHUNK):
+            chunk = urls[start:start + IN_FILTER_CHUNK]
+            try:
+                result = (
+                    self.client.table("articles")
+                    .select("article_url")
+                    .in_("article_url", chunk)
+                    .execute()
+                )
+                found.update(r["article_url"] for r in (result.data or []) if r.get("article_url"))
+            except Exception as e:
+                logger.warning("existing_urls failed: %s", e)
+        return found
+
+    def summaries_by_hash(self, hashes: list[str]) -> dict[str, str]:
+        """Map content_hash -> stored non-empty summary for the given hashes (one query per IN_FILTER_CHUNK)."""
+        found: dict[str, str] = {}
+        hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(hashes), IN_FILTER_CHUNK):
+            chunk = hashes[start:start + IN_FILTER_CHUNK]
+            try:
+                result = (
+                    self.client.table("articles")
+                    .select("content_hash, summary")
+                    .in_("content_hash", chunk)
+                    .neq("summary", "")
+                    .execute()
+                )
+                for r in result.data or []:
+                    if r.get("content_hash") and r.get("summary"):
+                        found.setdefault(r["content_hash"], r["summary"])
+            except Exception as e:
+                logger.warning("summaries_by_hash failed: %s", e)
+        return found
+
     def get_article_by_id(self, article_id: str) -> dict[str, Any] | None:
         """Fetch a single article by its ID for detail view."""
         try:
@@ -156,3 +265,80 @@ class ArticleRepository:
         except Exception as e:
             logger.exception("Get article by id failed: %s", e)
             return None
+
+    def get_articles_without_summary(self, limit: int = 1000, min_content_chars: int = 100) -> list[dict[str, Any]]:
+        """
+        Articles with at least min_content_chars of content but no summary yet (id, title, full_content),
+        newest first. Shorter ones are never summarized, so they must not take up the limit on every run.
+        """
+        try:
+            result = (
+                self.client.table("articles")
+                .select("id, title, full_content")
+                .or_("summary.is.null,summary.eq.")
+                # LIKE '_..._%': one '_' per required character
+                .like("full_content", "_" * min_content_chars + "*")
+                .order("created_at", desc=True)
+                .limit(limit)
+                .execute()
+            )
+            return result.data or []
+        except Exception as e:
+            logger.exception("Get articles without summary failed: %s", e)
+            return []
+
+    def update_summaries(self, summaries: dict[str, str]) -> int:
+        """
+        Set summary on existing articles by id. Returns the number of rows updated.
+        Articles sharing a summary are updated in one request; up to SUMMARY_UPDATE_CONCURRENCY run at once.
+        """
+        ids_by_summary: dict[str, list[str]] = {}
+        for article_id, summary in summaries.items():
+            ids_by_summary.setdefault(summary, []).append(article_id)
+
+        def update(group: tuple[str, list[str]]) -> int:
+            summary, ids = group
+            try:
+                result = (
+                    self.client.table("articles")
+                    .update({"summary": summary})
+                    .in_("id", ids)
+                    .execute()
+                )
+                return len(result.data or [])
+            except Exception as e:
+                logger.warning("Update summary for %s failed: %s", ", ".join(ids), e)
+                return 0
+
+        if not ids_by_summary:
+            return 0
+        # Independent PATCH round-trips on the pooled client (thread-safe)
+        with ThreadPoolExecutor(max_workers=min(SUMMARY_UPDATE_CONCURRENCY, len(ids_by_summary))) as ex:
+            return sum(ex.map(update, ids_by_summary.items()))
+
+    def get_pending_summary_batches(self) -> list[str]:
+        """Ids of submitted summary batches whose results have not been collected."""
+        try:
+            result = (
+                self.client.table("summary_batches")
+                .select("batch_id")
+                .eq("status", "submitted")
+                .execute()
+            )
+            return [r["batch_id"] for r in (result.data or []) if r.get("batch_id")]
+        except Exception as e:
+            logger.exception("Get pending summary batches failed: %s", e)
+            return []
+
+    def save_summary_batch(self, batch_id: str, status: str) -> None:
+        try:
+            self.client.table("summary_batches").upsert(
+                {
+                    "batch_id": batch_id,
+                    "status": status,
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                },
+                on_conflict="batch_id",
+            ).execute()
+        except Exception as e:
+            logger.exception("Save summary batch %s failed: %s", batch_id, e)
@@ -1,5 +1,6 @@
 """
 Entrypoint: run daily job once (for cron/CI) or start in-process scheduler.
+`python -m src.main --summary-batches` runs the Batch API summary job instead.
 """
 import logging
 import sys
@@ -10,6 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import LOG_LEVEL
 from src.scheduler.daily_job import run_daily_job
+from src.scheduler.summary_batch_job import run_summary_batch_job
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +23,17 @@ logger = logging.getLogger(__name__)
 
 
 def main() -> None:
-    """Run the daily scrape + summarize + store job once."""
+    """Run the daily scrape + summarize + store job once (or the summary batch job)."""
+    if "--summary-batches" in sys.argv[1:]:
+        logger.info("Starting summary batch job")
+        try:
+            run_summary_batch_job()
+        except Exception as e:
+            logger.exception("Summary batch job failed: %s", e)
+            sys.exit(1)
+        logger.info("Summary batch job completed successfully")
+        return
+
     logger.info("Starting daily news job")
     try:
         run_daily_job(skip_existing_urls=True, max_articles_per_source=25)
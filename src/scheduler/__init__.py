@@ -1,3 +1,4 @@
 from .daily_job import run_daily_job
+from .summary_batch_job import run_summary_batch_job
 
-__all__ = ["run_daily_job"]
+__all__ = ["run_daily_job", "run_summary_batch_job"]
@@ -1,23 +1,101 @@
 """
-Daily job: fetch feeds -> scrape full content -> summarize -> upsert to Supabase.
+Daily job: fetch feeds -> scrape full content -> summarize (batched) -> upsert to Supabase.
 Idempotent: safe to re-run; duplicates are avoided by article_url.
 """
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
+from src.config import BBC_EXCERPT_MIN_CHARS, SCRAPER_MAX_WORKERS, SUMMARY_MODE
 from src.db.article_repository import ArticleRepository
 from src.scraper.scrape_article import scrape_article_content, content_hash
 from src.scraper.bbc_scraper import scrape_bbc_article_page
 from src.scraper.google_news_scraper import fetch_google_news_full_content, resolve_google_news_url
 from src.scraper.site_scraper import collect_entries_for_sources
-from src.ai.summarize import summarize_with_openai
+from src.ai.summarize import summarize_many
 
 logger = logging.getLogger(__name__)
 
+# Articles written per bulk upsert request
+UPSERT_BATCH_SIZE = 100
+
+
+def _scrape_one(
+    entry: dict[str, Any],
+) -> Optional[tuple[str, Optional[str], Optional[str], str, Optional[str]]]:
+    """
+    Fetch full content for one entry, dispatching to the BBC, Google News or generic scraper.
+    Returns (article_url, full_content, image_url, content_hash, published_at), or None on error.
+    For Google News entries article_url is the resolved publisher URL.
+    """
+    url = entry["article_url"]
+    entry_source = entry.get("source") or "Unknown"
+    published_at = entry.get("published_at")
+    try:
+        # For BBC articles, use BBC-specific scraper for better content/image extraction
+        # For Google News, resolve URL and fetch from publisher
+        image_url = entry.get("image_url")
+        resolved_url = url  # Default to original URL
+
+        excerpt = entry.get("excerpt") or ""
+        if BBC_EXCERPT_MIN_CHARS and len(excerpt) >= BBC_EXCERPT_MIN_CHARS and published_at:
+            # The listing card already carries enough text to summarize and its date; skip the page GET
+            full_content = excerpt
+            hash_value = content_hash(excerpt)
+        elif url.startswith("https://www.bbc.com/") or url.startswith("http://www.bbc.com/"):
+            full_content, page_image, page_published = scrape_bbc_article_page(url)
+            if page_image:
+                image_url = page_image
+            if page_published and not published_at:
+                published_at = page_published
+            if not full_content:
+                # Fallback to generic scraper if BBC scraper didn't get content
+                full_content, image_url_fallback, hash_value = scrape_article_content(url)
+                if image_url_fallback and not image_url:
+                    image_url = image_url_fallback
+            else:
+                # Use content hash from BBC content
+                hash_value = content_hash(full_content) if full_content else content_hash(url)
+        elif entry.get("is_google_news_url") or "news.google.com" in url or "news.google.com" in (entry_source.lower()):
+            # Google News: resolve URL and fetch full content from publisher
+            full_content, image_url_fallback, resolved_url = fetch_google_news_full_content(url)
+            if image_url_fallback and not image_url:
+                image_url = image_url_fallback
+            hash_value = content_hash(full_content) if full_content else content_hash(resolved_url or url)
+            # Store resolved URL for better user experience
+            if resolved_url and resolved_url != url:
+                url = resolved_url
+        else:
+            # Non-BBC: use generic scraper
+            full_content, image_url_fallback, hash_value = scrape_article_content(url)
+            if image_url_fallback and not image_url:
+                image_url = image_url_fallback
+        return url, full_content, image_url, hash_value, published_at
+    except Exception as e:
+        logger.exception("Failed to process article %s: %s", url, e)
+        return None
+
+
+def _summarize_new(repo: ArticleRepository, articles: list[dict[str, Any]]) -> list[Optional[str]]:
+    """
+    Summaries aligned with `articles`. Content already summarized in an earlier run (same
+    content_hash) reuses the stored summary, and identical content in this run is summarized once.
+    """
+    known = repo.summaries_by_hash([a["content_hash"] for a in articles if a.get("full_content")])
+    todo: dict[str, dict[str, Any]] = {}
+    for a in articles:
+        if a["content_hash"] not in known:
+            todo.setdefault(a["content_hash"], a)
+    logger.info("Summarizing %d articles (%d reuse a stored summary)", len(todo), len(articles) - len(todo))
+    fresh = summarize_many([(a["title"], a["full_content"]) for a in todo.values()])
+    known.update({h: s for h, s in zip(todo, fresh) if s})
+    return [known.get(a["content_hash"]) for a in articles]
+
 
 def run_daily_job(skip_existing_urls: bool = True, max_articles_per_source: int = 25) -> None:
     """
     Run the full pipeline: sources -> feeds -> scrape -> summarize -> DB.
+    All articles are scraped first, then summarized in batches, then upserted.
     One bad article or source does not crash the job.
     """
     repo = ArticleRepository()
@@ -27,87 +105,103 @@ def run_daily_job(skip_existing_urls: bool = True, max_articles_per_source: int
         return
 
     # Use unified site_scraper module to discover article entries for all sources.
-    # Pass limit per source to collect_entries_for_sources
-    entries = collect_entries_for_sources(sources, limit_per_source=max_articles_per_source)
+    # Pass limit per source to collect_entries_for_sources. A forced re-run (skip_existing_urls=False)
+    # skips conditional feed GETs, which would return nothing for unchanged feeds.
+    validators_before = {s.get("id"): (s.get("etag"), s.get("last_modified")) for s in sources}
+    entries = collect_entries_for_sources(
+        sources, limit_per_source=max_articles_per_source, conditional=skip_existing_urls
+    )
 
-    processed = 0
-    # Process all collected entries (they are already limited per source)
-    for i, entry in enumerate(entries):
+    # One bulk lookup instead of a round-trip per entry
+    existing: set[str] = set()
+    if skip_existing_urls:
+        existing = repo.existing_urls([e["article_url"] for e in entries if e.get("article_url")])
 
+    candidates: list[dict[str, Any]] = []
+    for entry in entries:
         url = entry.get("article_url")
-        title = entry.get("title") or ""
+        if not url:
+            continue
+        if url in existing:
+            logger.debug("Skip existing URL: %s", url[:80])
+            continue
+        candidates.append(entry)
+
+    # Scraping is network-bound: fetch article pages concurrently.
+    # map() keeps results aligned with candidates; no more threads than there is work.
+    workers = max(1, min(SCRAPER_MAX_WORKERS, len(candidates)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(_scrape_one, candidates))
+    logger.info("Scraped %d candidate articles with %d workers", len(candidates), workers)
+
+    # Google News entries are stored under their resolved publisher URL, which the
+    # pre-scrape check above cannot see; drop those already stored before summarizing.
+    if skip_existing_urls:
+        resolved = [
+            r[0] for entry, r in zip(candidates, results)
+            if r is not None and r[0] != entry["article_url"]
+        ]
+        if resolved:
+            existing |= repo.existing_urls(resolved)
+
+    # Reversed so the first source with a given name wins, as with a linear scan
+    sources_by_name = {s.get("name"): s for s in reversed(sources)}
+    scraped: list[dict[str, Any]] = []
+    for entry, result in zip(candidates, results):
+        if result is None:
+            continue
+        url, full_content, image_url, hash_value, published_at = result
+        if url in existing:
+            logger.debug("Skip existing resolved URL: %s", url[:80])
+            continue
+
         entry_source = entry.get("source") or "Unknown"
-        published_at = entry.get("published_at")
-        source_id = None
-        source_name = entry_source
         # Match source by name (exact match)
-        for s in sources:
-            if s.get("name") == entry_source:
-                source_id = s.get("id")
-                source_name = s.get("name")
-                break
+        src = sources_by_name.get(entry_source)
+        source_id = src.get("id") if src else None
+        source_name = src.get("name") if src else entry_source
 
-        if not url:
-            continue
+        # If we have no content, still store the record with empty content and hash from URL
+        scraped.append({
+            "source_id": source_id,
+            "source_name": source_name,
+            "title": entry.get("title") or "",
+            "article_url": url,
+            "full_content": full_content,
+            "published_at": published_at,
+            "content_hash": hash_value,
+            "image_url": image_url,
+        })
 
-        try:
-            if skip_existing_urls and repo.article_exists_by_url(url):
-                logger.debug("Skip existing URL: %s", url[:80])
-                continue
-
-            # For BBC articles, use BBC-specific scraper for better content/image extraction
-            # For Google News, resolve URL and fetch from publisher
-            image_url = entry.get("image_url")
-            resolved_url = url  # Default to original URL
-            
-            if url.startswith("https://www.bbc.com/") or url.startswith("http://www.bbc.com/"):
-                full_content, page_image, page_published = scrape_bbc_article_page(url)
-                if page_image:
-                    image_url = page_image
-                if page_published and not published_at:
-                    published_at = page_published
-                if not full_content:
-                    # Fallback to generic scraper if BBC scraper didn't get content
-                    full_content, image_url_fallback, hash_value = scrape_article_content(url)
-                    if image_url_fallback and not image_url:
-                        image_url = image_url_fallback
-                else:
-                    # Use content hash from BBC content
-                    hash_value = content_hash(full_content) if full_content else content_hash(url)
-            elif entry.get("is_google_news_url") or "news.google.com" in url or "news.google.com" in (entry_source.lower()):
-                # Google News: resolve URL and fetch full content from publisher
-                full_content, image_url_fallback, resolved_url = fetch_google_news_full_content(url)
-                if image_url_fallback and not image_url:
-                    image_url = image_url_fallback
-                hash_value = content_hash(full_content) if full_content else content_hash(resolved_url or url)
-                # Store resolved URL for better user experience
-                if resolved_url and resolved_url != url:
-                    url = resolved_url
-            else:
-                # Non-BBC: use generic scraper
-                full_content, image_url_fallback, hash_value = scrape_article_content(url)
-                if image_url_fallback and not image_url:
-                    image_url = image_url_fallback
+    if SUMMARY_MODE == "batch":
+        # Summaries are filled in later by run_summary_batch_job via the Batch API
+        summaries: list[Optional[str]] = [None] * len(scraped)
+    else:
+        summaries = _summarize_new(repo, scraped)
+
+    processed = 0
+    pending: list[dict[str, Any]] = []
+    for article, summary in zip(scraped, summaries):
+        pending.append({**article, "summary": summary})
+        if len(pending) >= UPSERT_BATCH_SIZE:
+            processed += repo.upsert_articles_bulk(pending)
+            logger.info("Upserted %d articles so far", processed)
+            pending = []
+    if pending:
+        processed += repo.upsert_articles_bulk(pending)
 
-            # If we have no content, still store the record with empty content and hash from URL
-            summary = summarize_with_openai(title, full_content) if full_content else None
-
-            row = repo.upsert_article(
-                source_id=source_id,
-                source_name=source_name,
-                title=title,
-                article_url=url,
-                full_content=full_content,
-                summary=summary,
-                published_at=published_at,
-                content_hash=hash_value,
-                image_url=image_url,
-            )
-            if row:
-                processed += 1
-                logger.info("Upserted [%d]: %s", processed, title[:60])
-        except Exception as e:
-            logger.exception("Failed to process article %s: %s", url, e)
-            # Continue with next article
+    # RSS fetches recorded new ETag/Last-Modified on the source rows. Persist them only once every
+    # entry is stored: after a 304 the feed returns nothing, so anything missed would never be retried.
+    failed = sum(1 for r in results if r is None)
+    unstored = len({a["article_url"] for a in scraped}) - processed
+    if failed or unstored > 0:
+        logger.warning(
+            "Not saving feed validators: %d articles failed to scrape, %d failed to store", failed, max(unstored, 0)
+        )
+    else:
+        for s in sources:
+            validators = (s.get("etag"), s.get("last_modified"))
+            if s.get("id") and validators != validators_before.get(s.get("id")):
+                repo.update_feed_validators(s["id"], *validators)
 
     logger.info("Daily job finished; processed %d articles", processed)
@@ -0,0 +1,42 @@
+"""
+Summary batch job: collect finished OpenAI Batch API results, then submit
+unsummarized articles as a new batch. Run hourly alongside the daily job when
+SUMMARY_MODE=batch. Idempotent: a new batch is only submitted when none is in flight.
+"""
+import logging
+
+from src.ai.batch_summarize import FINAL_BATCH_STATUSES, fetch_summary_batch, submit_summary_batch
+from src.db.article_repository import ArticleRepository
+
+logger = logging.getLogger(__name__)
+
+
+def run_summary_batch_job(max_articles: int = 1000) -> None:
+    """Apply completed batch results and submit the next batch of unsummarized articles."""
+    repo = ArticleRepository()
+
+    in_flight = 0
+    for batch_id in repo.get_pending_summary_batches():
+        status, summaries = fetch_summary_batch(batch_id)
+        if status is None:
+            in_flight += 1
+            continue
+        if summaries:
+            updated = repo.update_summaries(summaries)
+            logger.info("Batch %s: stored %d summaries", batch_id, updated)
+        if status in FINAL_BATCH_STATUSES:
+            repo.save_summary_batch(batch_id, status)
+        else:
+            in_flight += 1
+
+    if in_flight:
+        logger.info("%d summary batch(es) still in progress; not submitting another", in_flight)
+        return
+
+    articles = repo.get_articles_without_summary(limit=max_articles)
+    if not articles:
+        logger.info("No articles waiting for a summary")
+        return
+    batch_id = submit_summary_batch(articles)
+    if batch_id:
+        repo.save_summary_batch(batch_id, "submitted")
@@ -4,18 +4,63 @@ Extracts article URLs, titles, images, dates from https://www.bbc.com/news/* pag
 """
 import logging
 import re
-import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
-from src.config import SCRAPER_DELAY_SECONDS, DEFAULT_HEADERS
+from src.scraper.http import fetch_bytes
 
 logger = logging.getLogger(__name__)
 
+# Section/category pages (path ends with one of these)
+_SECTION_PATTERN = (
+    r"(?:world|business|technology|science|health|entertainment|arts|video|audio|correspondents"
+    r"|editors|have_your_say|england|scotland|wales|northern_ireland|politics|education|magazine"
+    r"|uk|us_canada|africa|asia|australia|europe|latin_america|middle_east|pictures|indepth"
+    r"|verify|ouch|worklife|culture|future|reel|for_you|more|updated|uk-politics|world-politics)$"
+)
+# Whole article-URL classification in one compiled pattern (applied to the lowercased path);
+# it runs for every link on a section page.
+_ARTICLE_PATH_RE = re.compile(
+    r"^(?=.*/(?:news|sport)/)"  # must be under /news/ or /sport/
+    r"(?!.*/(?:live|av|weather|travel|help)/)"  # skip live, video, audio, ... pages
+    r"(?:.*/articles/"  # new format: /news/articles/c5e74z5j8e1o
+    r"|.*\d{5,}/*$"  # old format, numeric ID ending the last segment: /news/world-us-canada-12345678
+    r"|(?!.*" + _SECTION_PATTERN + r")(?=.*/sport/).*\d{5,})"  # sport article (not a section page) with an ID
+)
+_IMG_SRC_TEST = (
+    'contains(@src, "ichef") or contains(@src, ".jpg") or contains(@src, ".jpeg")'
+    ' or contains(@src, ".png") or contains(@src, ".webp")'
+)
+# Image lookups for _extract_image_url in priority order: (XPath for the first candidate, attributes read for the URL).
+# Attribute tests are XPath predicates, so matching happens inside libxml2 rather than per tag in Python.
+_IMAGE_LOOKUPS = (
+    ('(//meta[@property="og:image"])[1]', ("content",)),  # og:image (most reliable)
+    ('(//img[contains(@data-src, "ichef")])[1]', ("data-src", "src")),  # BBC's image components
+    (f"(//main//img[{_IMG_SRC_TEST}])[1]", ("src", "data-src")),  # any image in main/article
+    (f"(//article//img[{_IMG_SRC_TEST}])[1]", ("src", "data-src")),
+)
+# Elements stripped from the article body before reading text
+_UNWANTED_XPATH = (
+    ".//script | .//style | .//noscript | .//time | .//figcaption"
+    ' | .//*[contains(concat(" ", normalize-space(@class), " "), " visually-hidden ")]'
+    ' | .//*[@data-component="image-block" or @data-component="video-block"]'
+)
+
+
+def _first(nodes: list[Any]) -> Any:
+    """First XPath result or None."""
+    return nodes[0] if nodes else None
+
+
+def _text(node: Any) -> str:
+    """Element text with each piece stripped and joined (same as BS4 get_text(strip=True))."""
+    return "".join(t.strip() for t in node.itertext())
+
 
 def _parse_bbc_date(date_str: Optional[str]) -> Optional[str]:
     """Parse BBC date string to ISO format."""
@@ -31,124 +76,55 @@ def _parse_bbc_date(date_str: Optional[str]) -> Optional[str]:
     return None
 
 
-def _extract_image_url(soup: BeautifulSoup, article_url: str) -> Optional[str]:
-    """Extract article image from BBC page (og:image, or BBC's image tags)."""
-    # Try og:image first (most reliable)
-    og_image = soup.find("meta", property="og:image")
-    if og_image and og_image.get("content"):
-        img_url = og_image["content"]
-        if img_url.startswith("//"):
-            img_url = "https:" + img_url
-        elif img_url.startswith("/"):
-            parsed = urlparse(article_url)
-            img_url = f"{parsed.scheme}://{parsed.netloc}{img_url}"
-        return img_url
-
-    # Try BBC's image components
-    img_tag = soup.find("img", {"data-src": re.compile(r"ichef|ichef\.bbci")})
-    if img_tag:
-        src = img_tag.get("data-src") or img_tag.get("src")
+def _abs_image_url(src: str, article_url: str) -> str:
+    """Make a protocol-relative or root-relative image src absolute."""
+    if src.startswith("//"):
+        return "https:" + src
+    if src.startswith("/"):
+        parsed = urlparse(article_url)
+        return f"{parsed.scheme}://{parsed.netloc}{src}"
+    return src
+
+
+def _extract_image_url(tree: Any, article_url: str) -> Optional[str]:
+    """Extract article image from BBC page (og:image, or BBC's image tags); first lookup that hits wins."""
+    for path, url_attrs in _IMAGE_LOOKUPS:
+        el = _first(tree.xpath(path))
+        if el is None:
+            continue
+        src = next((el.get(a) for a in url_attrs if el.get(a)), None)
         if src:
-            if src.startswith("//"):
-                return "https:" + src
-            if src.startswith("/"):
-                parsed = urlparse(article_url)
-                return f"{parsed.scheme}://{parsed.netloc}{src}"
-            return src
-
-    # Try any image in article header/main
-    main = soup.find("main") or soup.find("article")
-    if main:
-        img = main.find("img", src=re.compile(r"ichef|\.jpg|\.png"))
-        if img:
-            src = img.get("src") or img.get("data-src")
-            if src:
-                if src.startswith("//"):
-                    return "https:" + src
-                if src.startswith("/"):
-                    parsed = urlparse(article_url)
-                    return f"{parsed.scheme}://{parsed.netloc}{src}"
-                return src
+            return _abs_image_url(src, article_url)
     return None
 
 
+@lru_cache(maxsize=4096)
 def _is_bbc_article_url(url: str) -> bool:
-    """Check if URL is a BBC article (not section/navigation page)."""
-    path = urlparse(url).path.lower()
-    # Must contain /news/ or /sport/
-    if "/news/" not in path and "/sport/" not in path:
-        return False
-    # Skip live pages, video pages, audio pages
-    if any(skip in path for skip in ["/live/", "/av/", "/weather/", "/travel/", "/help/"]):
-        return False
-    
-    # BBC articles have patterns like:
-    # /news/articles/c5e74z5j8e1o (new format)
-    # /news/world-us-canada-12345678 (old format with numeric ID at end)
-    # /sport/football/12345678 (sport articles)
-    
-    # Check if it's an article by looking for:
-    # 1. /articles/ path (new format)
-    if "/articles/" in path:
-        return True
-    
-    # 2. Numeric ID at end of path (old format: .../world-us-canada-12345678)
-    # Extract last path segment
-    path_parts = path.rstrip("/").split("/")
-    if path_parts:
-        last_segment = path_parts[-1]
-        # If last segment has 5+ digits, it's likely an article
-        if re.search(r'\d{5,}$', last_segment):
-            return True
-    
-    # 3. Skip known section/category pages
-    section_keywords = [
-        r'world$', r'business$', r'technology$', r'science$', r'health$',
-        r'entertainment$', r'arts$', r'video$', r'audio$', r'correspondents$',
-        r'editors$', r'have_your_say$', r'england$', r'scotland$', r'wales$',
-        r'northern_ireland$', r'politics$', r'education$', r'magazine$',
-        r'uk$', r'us_canada$', r'africa$', r'asia$', r'australia$', r'europe$',
-        r'latin_america$', r'middle_east$', r'pictures$', r'indepth$',
-        r'verify$', r'ouch$', r'worklife$', r'culture$', r'future$', r'reel$',
-        r'for_you$', r'more$', r'updated$', r'uk-politics$', r'world-politics$'
-    ]
-    for keyword in section_keywords:
-        if re.search(keyword, path):
-            return False
-    
-    # 4. Skip sport section pages (but allow sport articles)
-    # Sport articles have numeric IDs: /sport/football/12345678
-    if "/sport/" in path:
-        # Check if it has numeric ID
-        if re.search(r'\d{5,}', path):
-            return True
-        # Otherwise it's a section page like /sport/football
-        return False
-    
-    # If none of the above, likely not an article
-    return False
+    """Check if URL is a BBC article (not section/navigation page). Cached: sections share many links."""
+    return _ARTICLE_PATH_RE.match(urlparse(url).path.lower()) is not None
 
 
 def scrape_bbc_section(section_url: str, category: str) -> list[dict[str, Any]]:
     """
     Scrape BBC section page (e.g., /news/business, /news/technology) for article links.
-    Returns list of article entries: title, article_url, image_url, published_at, source.
+    Returns list of article entries: title, article_url, image_url, excerpt, published_at, source.
     """
     entries: list[dict[str, Any]] = []
     try:
-        resp = requests.get(section_url, headers=DEFAULT_HEADERS, timeout=15, allow_redirects=True)
-        resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
+        _, body = fetch_bytes(section_url, timeout=15, allow_redirects=True)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = lxml_html.fromstring(body)
 
         # BBC uses various selectors for article links
         article_links = []
+        # First <a> per raw href attribute, so card lookups below are O(1) instead of a DOM scan
+        links_by_href: dict[str, Any] = {}
         # Main story cards - look for article links with numeric IDs or article patterns
-        for link in soup.select('a[href*="/news/"], a[href*="/sport/"]'):
+        for link in tree.xpath('//a[contains(@href, "/news/") or contains(@href, "/sport/")]'):
             href = link.get("href", "")
             if not href or href.startswith("#"):
                 continue
+            links_by_href.setdefault(href, link)
             if href.startswith("/"):
                 href = urljoin("https://www.bbc.com", href)
             # Skip non-article pages
@@ -164,42 +140,55 @@ def scrape_bbc_section(section_url: str, category: str) -> list[dict[str, Any]]:
                 break
             try:
                 # Try to find title and image from the listing card
-                link_elem = soup.find("a", href=url.replace("https://www.bbc.com", ""))
-                if not link_elem:
-                    link_elem = soup.find("a", href=url)
+                link_elem = links_by_href.get(url.replace("https://www.bbc.com", ""))
+                if link_elem is None:
+                    link_elem = links_by_href.get(url)
 
                 title = None
-                if link_elem:
+                if link_elem is not None:
                     # Title might be in the link text or a child element
-                    title_elem = link_elem.find(["h2", "h3", "span"], class_=re.compile("title|headline"))
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                    elif link_elem.get_text(strip=True):
-                        title = link_elem.get_text(strip=True)[:200]
+                    title_elem = _first(link_elem.xpath(
+                        './/*[self::h2 or self::h3 or self::span]'
+                        '[contains(@class, "title") or contains(@class, "headline")]'
+                    ))
+                    if title_elem is not None:
+                        title = _text(title_elem)
+                    elif _text(link_elem):
+                        title = _text(link_elem)[:200]
 
                 if not title or len(title) < 10:
                     continue
 
+                # Card description (lede), if the listing shows one
+                excerpt = None
+                if link_elem is not None:
+                    desc = _first(link_elem.xpath('.//*[@data-testid="card-description"] | .//p'))
+                    if desc is not None:
+                        excerpt = _text(desc) or None
+
+                # Card timestamp, if the listing shows one (otherwise the article page supplies the date)
+                published_at = None
+                if link_elem is not None:
+                    card_time = _first(link_elem.xpath(".//time[@datetime]"))
+                    if card_time is not None:
+                        published_at = _parse_bbc_date(card_time.get("datetime"))
+
                 # Extract image from listing card
                 image_url = None
-                if link_elem:
-                    img = link_elem.find("img")
-                    if img:
+                if link_elem is not None:
+                    img = _first(link_elem.xpath(".//img"))
+                    if img is not None:
                         src = img.get("src") or img.get("data-src")
                         if src:
-                            if src.startswith("//"):
-                                image_url = "https:" + src
-                            elif src.startswith("/"):
-                                image_url = urljoin("https://www.bbc.com", src)
-                            else:
-                                image_url = src
+                            image_url = _abs_image_url(src, "https://www.bbc.com")
 
                 entries.append({
                     "title": title,
                     "article_url": url,
                     "image_url": image_url,
+                    "excerpt": excerpt,
                     "source": f"BBC {category}",
-                    "published_at": None,  # Will be fetched from article page
+                    "published_at": published_at,  # None: fetched from the article page
                 })
             except Exception as e:
                 logger.debug("Failed to extract metadata for %s: %s", url, e)
@@ -219,48 +208,48 @@ def scrape_bbc_article_page(article_url: str) -> tuple[Optional[str], Optional[s
     Returns (full_content, image_url, published_at_iso).
     """
     try:
-        resp = requests.get(article_url, headers=DEFAULT_HEADERS, timeout=15, allow_redirects=True)
-        resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
+        _, body = fetch_bytes(article_url, timeout=15, allow_redirects=True)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # One lxml parse serves content, image and date extraction
+        tree = lxml_html.fromstring(body)
 
         # Extract full content
         content_parts = []
         # BBC uses <article> or <main> with <div data-component="text-block">
-        article = soup.find("article") or soup.find("main")
-        if article:
-            # Remove unwanted elements that might pollute text
-            for unwanted in article.select("script, style, noscript, time, .visually-hidden, figcaption, [data-component='image-block'], [data-component='video-block']"):
-                unwanted.decompose()
-                
-            for block in article.find_all("div", {"data-component": "text-block"}):
-                text = block.get_text(separator=" ", strip=True)
+        article = _first(tree.xpath("//article") or tree.xpath("//main"))
+        if article is not None:
+            # Remove unwanted elements that might pollute text (tail text is kept)
+            for unwanted in article.xpath(_UNWANTED_XPATH):
+                if unwanted.getparent() is not None:
+                    unwanted.drop_tree()
+
+            for block in article.xpath('.//div[@data-component="text-block"]'):
+                text = " ".join(t.strip() for t in block.itertext() if t.strip())
                 if text and len(text) > 20:
                     content_parts.append(text)
             # Fallback: get all paragraphs
             if not content_parts:
-                for p in article.find_all("p"):
-                    text = p.get_text(strip=True)
+                for p in article.iter("p"):
+                    text = _text(p)
                     if text and len(text) > 20:
                         content_parts.append(text)
 
         full_content = " ".join(content_parts).strip() if content_parts else None
 
         # Extract image
-        image_url = _extract_image_url(soup, article_url)
+        image_url = _extract_image_url(tree, article_url)
 
         # Extract published date
         published_at = None
-        time_elem = soup.find("time", {"data-testid": "timestamp"}) or soup.find("time")
-        if time_elem:
+        time_elem = _first(tree.xpath('//time[@data-testid="timestamp"]') or tree.xpath("//time"))
+        if time_elem is not None:
             datetime_attr = time_elem.get("datetime") or time_elem.get("data-datetime")
             if datetime_attr:
                 published_at = _parse_bbc_date(datetime_attr)
         if not published_at:
             # Try meta tag
-            meta_time = soup.find("meta", property="article:published_time")
-            if meta_time:
+            meta_time = _first(tree.xpath('//meta[@property="article:published_time"]'))
+            if meta_time is not None:
                 published_at = _parse_bbc_date(meta_time.get("content"))
 
         return full_content, image_url, published_at
@@ -1,23 +1,19 @@
 """
 Fetch article entries from configured RSS/Atom feeds.
-Uses feedparser; respects rate limiting via configurable delay.
+Uses feedparser; respects per-host rate limiting via configurable delay.
 """
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urljoin
 
 import feedparser
 import requests
-from src.config import SCRAPER_DELAY_SECONDS, DEFAULT_HEADERS
+from src.scraper.http import SESSION, throttle
 
 logger = logging.getLogger(__name__)
 
-# Default User-Agent; some feeds require it
-# DEFAULT_HEADERS imported from config now
-
-
 def _parse_date(entry: Any) -> datetime | None:
     """Parse published/updated date from feed entry into timezone-aware datetime."""
     for key in ("published_parsed", "updated_parsed"):
@@ -30,6 +26,18 @@ def _parse_date(entry: Any) -> datetime | None:
     return None
 
 
+def feed_response_headers(resp: requests.Response) -> dict[str, str]:
+    """
+    The response headers feedparser actually reads (charset, base URL, language).
+    requests has already decompressed the body, so Content-Encoding etc. are left out.
+    """
+    return {
+        name: resp.headers[name]
+        for name in ("content-type", "content-location", "content-language")
+        if name in resp.headers
+    }
+
+
 def _get_link(entry: Any) -> str:
     """Get canonical article URL from entry (link or first link)."""
     link = getattr(entry, "link", None)
@@ -41,25 +49,36 @@ def _get_link(entry: Any) -> str:
     return ""
 
 
-def fetch_feed(feed_url: str, source_name: str) -> list[dict[str, Any]]:
+def fetch_feed(
+    feed_url: str, source_name: str, validators: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
     """
     Fetch a single RSS/Atom feed and return list of article entries.
     Each entry: title, article_url, source, published_at (ISO string or None).
     Does not fetch full article content here (done in scrape_article).
+    If `validators` (e.g. the source row) holds etag/last_modified, a conditional GET is
+    made and [] returned on 304; new validators from the response are written back into it.
     """
     entries: list[dict[str, Any]] = []
+    headers: dict[str, str] = {}
+    if validators is not None:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
     try:
-        # feedparser can use a URL; we pass request headers via request
-        resp = requests.get(
-            feed_url,
-            headers=DEFAULT_HEADERS,
-            timeout=30,
-            allow_redirects=True,
-        )
+        # Fetch via the shared session (keep-alive, default headers, retries)
+        throttle(feed_url)
+        resp = SESSION.get(feed_url, headers=headers, timeout=30, allow_redirects=True)
+        if resp.status_code == 304:
+            logger.info("Feed unchanged since last run: %s", source_name)
+            return entries
         resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
+        if validators is not None:
+            validators["etag"] = resp.headers.get("ETag")
+            validators["last_modified"] = resp.headers.get("Last-Modified")
 
-        parsed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+        parsed = feedparser.parse(resp.content, response_headers=feed_response_headers(resp))
         if parsed.bozo and not getattr(parsed, "entries", None):
             logger.warning("Feed parse warning for %s: %s", source_name, parsed.bozo_exception)
 
@@ -86,17 +105,24 @@ def fetch_feed(feed_url: str, source_name: str) -> list[dict[str, Any]]:
 
 def fetch_all_feeds(sources: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
-    Fetch all given sources (each with name, feed_url).
-    Returns combined list of article entries; one bad feed does not crash the job.
+    Fetch all given sources (each with name, feed_url) concurrently.
+    Returns combined list of article entries in source order; one bad feed does not crash the job.
     """
-    all_entries: list[dict[str, Any]] = []
+    feeds: list[tuple[str, str]] = []
     for src in sources:
         name = src.get("name") or "Unknown"
         feed_url = src.get("feed_url")
         if not feed_url:
             logger.warning("Source %s has no feed_url, skipping", name)
             continue
-        entries = fetch_feed(feed_url, name)
-        all_entries.extend(entries)
-        time.sleep(SCRAPER_DELAY_SECONDS)
+        feeds.append((feed_url, name))
+    if not feeds:
+        return []
+
+    # Feeds live on different hosts, so fetch them in parallel; fetch_feed's
+    # per-host throttle still spaces out any feeds that share a host.
+    all_entries: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=min(16, len(feeds))) as ex:
+        for entries in ex.map(lambda f: fetch_feed(*f), feeds):
+            all_entries.extend(entries)
     return all_entries
@@ -2,21 +2,64 @@
 Google News scraper: fetch articles from Google News RSS and resolve to full content.
 Google News RSS gives encoded URLs that redirect to publisher sites.
 """
+import base64
+import binascii
 import logging
 import re
-import time
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 
 import requests
 from bs4 import BeautifulSoup
 
-from src.config import SCRAPER_DELAY_SECONDS, DEFAULT_HEADERS
+from src.scraper.fetch_sources import feed_response_headers
+from src.scraper.http import SESSION, fetch_bytes, throttle
 from src.scraper.scrape_article import scrape_article_content, content_hash
 
 logger = logging.getLogger(__name__)
 
 
+def _read_varint(raw: bytes, pos: int) -> tuple[int, int]:
+    """Decode a protobuf varint at raw[pos]; returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = raw[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _decode_google_news_id(google_url: str) -> Optional[str]:
+    """
+    Extract the publisher URL embedded in a Google News article ID, without any HTTP request.
+    Classic IDs (/rss/articles/CBMi...) are base64 protobufs whose field 4 is the URL; newer
+    opaque IDs do not contain it, in which case this returns None.
+    """
+    parts = urlparse(google_url).path.split("/")
+    try:
+        encoded = parts[parts.index("articles") + 1]
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        pos = 0
+        while pos < len(raw):
+            key, pos = _read_varint(raw, pos)
+            wire_type = key & 0x07
+            if wire_type == 0:
+                _, pos = _read_varint(raw, pos)
+            elif wire_type == 2:
+                length, pos = _read_varint(raw, pos)
+                value = raw[pos:pos + length]
+                pos += length
+                if key >> 3 == 4 and value.startswith((b"http://", b"https://")):
+                    return value.decode("utf-8")
+            else:
+                return None
+    except (binascii.Error, ValueError, IndexError):
+        return None
+    return None
+
+
 def resolve_google_news_url(google_url: str) -> Optional[str]:
     """
     Resolve a Google News URL to the actual publisher URL.
@@ -27,24 +70,25 @@ def resolve_google_news_url(google_url: str) -> Optional[str]:
         # https://news.google.com/rss/articles/CBMi... (encoded)
         # These are base64-like encoded URLs that need to be decoded
         
+        # Strategy 0: the URL is often embedded in the article ID itself - no request needed
+        decoded = _decode_google_news_id(google_url)
+        if decoded:
+            return decoded
+
         # Strategy 1: Try to follow redirects (sometimes works with proper headers)
-        session = requests.Session()
-        # Mimic a real browser more closely
+        # Mimic a real browser more closely (merged over the shared session's defaults)
         headers = {
-            **DEFAULT_HEADERS,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
             "Referer": "https://news.google.com/",
         }
         
-        resp = session.get(
+        resp, body = fetch_bytes(
             google_url,
             headers=headers,
             timeout=15,
             allow_redirects=True,
         )
-        resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
         
         final_url = resp.url
         # If we got redirected to a real publisher site, return it
@@ -52,7 +96,7 @@ def resolve_google_news_url(google_url: str) -> Optional[str]:
             return final_url
         
         # Strategy 2: Parse the Google News page to find the external link
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(body, "lxml")
         
         # Look for the article title link (usually the main external link)
         # Google News uses various layouts, try multiple selectors
@@ -99,11 +143,11 @@ def scrape_google_news_topic(topic_url: str = "https://news.google.com/rss?hl=en
     
     entries: list[dict[str, Any]] = []
     try:
-        resp = requests.get(topic_url, headers=DEFAULT_HEADERS, timeout=30, allow_redirects=True)
+        throttle(topic_url)
+        resp = SESSION.get(topic_url, timeout=30, allow_redirects=True)
         resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
         
-        parsed = feedparser.parse(resp.content)
+        parsed = feedparser.parse(resp.content, response_headers=feed_response_headers(resp))
         if parsed.bozo and not getattr(parsed, "entries", None):
             logger.warning("Google News RSS parse warning: %s", parsed.bozo_exception)
         
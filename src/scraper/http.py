@@ -0,0 +1,109 @@
+"""
+Shared HTTP session for the scrapers: keep-alive connection pooling and retries.
+requests.Session is safe to share across threads for plain GETs (urllib3 pools are thread-safe).
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import DEFAULT_HEADERS, SCRAPER_CACHE_PATH, SCRAPER_DELAY_SECONDS, SCRAPER_MAX_WORKERS
+
+# How long cached article pages are reused (only with SCRAPER_CACHE_PATH)
+ARTICLE_CACHE_SECONDS = 24 * 60 * 60
+# Distinct hosts whose keep-alive connection pools are retained
+HOST_POOLS = 128
+
+
+def _build_session(cache_path: str = "") -> requests.Session:
+    if cache_path:
+        import requests_cache
+
+        session = requests_cache.CachedSession(
+            cache_path,
+            expire_after=ARTICLE_CACHE_SECONDS,
+            allowable_codes=(200,),
+            allowable_methods=("GET",),
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+    )
+    # Keep at least one pooled connection per worker thread so concurrent requests
+    # to one host (BBC, news.google.com) reuse sockets instead of discarding them.
+    # Host pools are kept in an LRU; room for many hosts stops one-off publisher hosts
+    # (Google News results) from evicting the busy ones and forcing new connections + DNS lookups.
+    adapter = HTTPAdapter(
+        pool_connections=HOST_POOLS,
+        pool_maxsize=max(64, SCRAPER_MAX_WORKERS),
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _build_session()
+# Article pages: the same as SESSION unless SCRAPER_CACHE_PATH enables the on-disk cache.
+# Feeds stay on SESSION so their conditional GETs always reach the server.
+ARTICLE_SESSION = _build_session(SCRAPER_CACHE_PATH) if SCRAPER_CACHE_PATH else SESSION
+
+# Per-host politeness: time of the last request to each host, and one lock per host
+_last_hit: dict[str, float] = {}
+_host_locks: dict[str, threading.Lock] = {}
+_host_locks_guard = threading.Lock()
+
+
+def throttle(url: str, min_interval: float = SCRAPER_DELAY_SECONDS) -> None:
+    """
+    Block until at least min_interval seconds have passed since the last request to url's host.
+    Requests to different hosts never wait on each other.
+    """
+    host = urlparse(url).netloc.lower()
+    with _host_locks_guard:
+        lock = _host_locks.setdefault(host, threading.Lock())
+    with lock:
+        wait = _last_hit.get(host, 0.0) + min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_hit[host] = time.monotonic()
+
+
+# Pages larger than this are truncated rather than buffered whole (bounds memory per worker)
+MAX_HTML_BYTES = 4 << 20
+
+
+def fetch_bytes(
+    url: str,
+    timeout: float = 15,
+    max_bytes: int = MAX_HTML_BYTES,
+    session: requests.Session = SESSION,
+    **kwargs,
+) -> tuple[requests.Response, bytes]:
+    """
+    GET url on the shared session (or `session`), streaming the body and stopping after max_bytes.
+    Throttled per host and raises for HTTP errors like resp.raise_for_status().
+    Returns (response, body); use the returned body, not resp.content.
+    """
+    # A page served from the on-disk cache never reaches the host, so it skips the throttle
+    cache = getattr(session, "cache", None)
+    if cache is None or not cache.contains(url=url):
+        throttle(url)
+    with session.get(url, timeout=timeout, stream=True, **kwargs) as resp:
+        resp.raise_for_status()
+        buf = bytearray()
+        for chunk in resp.iter_content(65536):
+            buf.extend(chunk)
+            if len(buf) >= max_bytes:
+                del buf[max_bytes:]
+                break
+        return resp, bytes(buf)
@@ -1,46 +1,121 @@
 """
-Fetch full article content from a URL using newspaper3k + BeautifulSoup fallback.
+Fetch full article content from a URL using trafilatura, with newspaper3k and lxml fallbacks.
 Handles failures gracefully; one bad article does not crash the job.
 """
 import hashlib
 import logging
-import time
-from typing import Optional
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Optional
+from urllib.parse import urlparse
 
 import requests
-from newspaper import Article
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+import trafilatura
+from newspaper import Article, Config
 
-from src.config import SCRAPER_DELAY_SECONDS, DEFAULT_HEADERS
+from src.config import SCRAPER_PARSE_PROCESSES
+from src.scraper.http import ARTICLE_SESSION, fetch_bytes
 
 logger = logging.getLogger(__name__)
 
+# Image candidates in one pass, first in document order wins: og:image (in <head>, so ahead of any
+# body image), then images inside <article>/<main>
+_IMAGE_XPATH = etree.XPath(
+    '//meta[@property="og:image"]/@content[normalize-space()]'
+    " | //article//img/@src[normalize-space()]"
+    " | //main//img/@src[normalize-space()]"
+)
 
-def content_hash(text: str) -> str:
-    """SHA-256 hash of normalized content for deduplication."""
-    normalized = (text or "").strip().encode("utf-8")
-    return hashlib.sha256(normalized).hexdigest()
+# Inputs up to this length (URLs) get their content_hash memoized
+CACHED_HASH_MAX_CHARS = 2048
+_EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+
+# Fast path: an <article> with more than this many paragraphs is read directly, if it yields enough text
+ARTICLE_MIN_PARAGRAPHS = 3
+ARTICLE_MIN_CHARS = 200
+
+# newspaper3k in parse-only mode: no image downloads, no article memo cache, short timeout if it ever fetches
+_NEWSPAPER_CONFIG = Config()
+_NEWSPAPER_CONFIG.fetch_images = False
+_NEWSPAPER_CONFIG.memoize_articles = False
+_NEWSPAPER_CONFIG.http_success_only = False
+_NEWSPAPER_CONFIG.request_timeout = 1
+
+# Leading <?xml ...?> declaration; its encoding no longer applies to already-decoded text
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# Likely article containers for the fallback extractor, in priority order (compiled to XPath once)
+_CONTENT_SELECTORS = [
+    CSSSelector(sel)
+    for sel in ("article", "main", "[role='main']", ".post-content", ".article-body", ".content")
+]
+
+
+def _first(nodes: list[Any]) -> Any:
+    """First XPath/selector result or None."""
+    return nodes[0] if nodes else None
+
+
+@lru_cache(maxsize=8192)
+def _short_text_hash(text: str) -> str:
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+def content_hash(text: str | bytes | None) -> str:
+    """
+    SHA-256 hash of normalized content for deduplication. Bytes are hashed as-is (no decode/encode).
+    Short inputs (URLs, hashed again on every fallback and re-run) are memoized; article bodies are
+    not, so the cache never pins large texts in memory.
+    """
+    if isinstance(text, (bytes, bytearray)):
+        return hashlib.sha256(text.strip()).hexdigest()
+    if not text:
+        return _EMPTY_HASH
+    if len(text) <= CACHED_HASH_MAX_CHARS:
+        return _short_text_hash(text)
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
 
 
 def _fetch_html(url: str) -> Optional[str]:
-    """Fetch raw HTML with basic error handling and rate limiting."""
+    """Fetch raw HTML (capped at MAX_HTML_BYTES) with basic error handling and per-host rate limiting."""
     try:
-        resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=15, allow_redirects=True)
-        resp.raise_for_status()
-        time.sleep(SCRAPER_DELAY_SECONDS)
-        return resp.text
+        resp, body = fetch_bytes(url, timeout=15, session=ARTICLE_SESSION, allow_redirects=True)
+        try:
+            return body.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Server declared a charset Python does not know
+            return body.decode("utf-8", errors="replace")
     except requests.RequestException as e:
         logger.warning("HTTP request failed for %s: %s", url, e)
         return None
 
 
+def _extract_with_trafilatura(url: str, html: str) -> Optional[str]:
+    """Extract main article text using trafilatura (fast, main-text only)."""
+    try:
+        text = (trafilatura.extract(html, url=url, include_comments=False, include_tables=False) or "").strip()
+        return text if text else None
+    except Exception as e:
+        logger.debug("Trafilatura extraction failed for %s: %s", url, e)
+        return None
+
+
 def _extract_with_newspaper(url: str, html: Optional[str] = None) -> Optional[str]:
     """Extract main article text using newspaper3k."""
     try:
-        article = Article(url)
         if html:
-            article.download(input_html=html)
+            # Parse the HTML we already have; set_html() never touches the network
+            article = Article(url, config=_NEWSPAPER_CONFIG)
+            article.set_html(html)
         else:
+            article = Article(url)
             article.download()
         article.parse()
         text = (article.text or "").strip()
@@ -50,30 +125,117 @@ def _extract_with_newspaper(url: str, html: Optional[str] = None) -> Optional[st
         return None
 
 
-def _extract_with_bs4(html: str) -> Optional[str]:
-    """Fallback: extract text from likely article containers."""
+def _parse_html(html: str) -> Optional[Any]:
+    """Parse HTML into an lxml tree; None if it cannot be parsed."""
+    # lxml rejects str input that carries an XML encoding declaration; the text is already decoded
+    html = _XML_DECLARATION_RE.sub("", html, count=1)
+    try:
+        return lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug("HTML parse failed: %s", e)
+        return None
+
+
+def _node_text(node: Any) -> str:
+    """
+    Text of node, each text piece stripped and joined by a space (same as BS4 get_text(" ", strip=True)).
+    Joining pieces keeps adjacent blocks and <br> lines apart in minified HTML with no whitespace between them.
+    """
+    return " ".join(t.strip() for t in node.itertext() if t.strip())
+
+
+def _extract_article_paragraphs(tree: Any) -> Optional[str]:
+    """
+    Fast path for structured (CMS) pages: the paragraphs of the first <article> with more than
+    ARTICLE_MIN_PARAGRAPHS <p>. None if there is no such article or it yields < ARTICLE_MIN_CHARS.
+    """
+    article = _first(tree.xpath(f"(//article[count(.//p) > {ARTICLE_MIN_PARAGRAPHS}])[1]"))
+    if article is None:
+        return None
+    paragraphs = [text for text in (_node_text(p) for p in article.iter("p")) if text]
+    text = "\n\n".join(paragraphs)
+    return text if len(text) >= ARTICLE_MIN_CHARS else None
+
+
+def _extract_with_lxml(tree: Any) -> Optional[str]:
+    """Fallback: extract text from likely article containers. Strips script/style from `tree` in place."""
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        # Remove script/style
-        for tag in soup(["script", "style"]):
-            tag.decompose()
+        # Remove script/style (tail text is kept)
+        for tag in tree.xpath("//script | //style"):
+            if tag.getparent() is not None:
+                tag.drop_tree()
         # Prefer article or main
-        for selector in ("article", "main", "[role='main']", ".post-content", ".article-body", ".content"):
-            node = soup.select_one(selector)
-            if node:
-                text = node.get_text(separator=" ", strip=True)
+        for selector in _CONTENT_SELECTORS:
+            node = _first(selector(tree))
+            if node is not None:
+                text = _node_text(node)
                 if len(text) > 100:
                     return text
         # Fallback to body
-        body = soup.find("body")
-        if body:
-            return body.get_text(separator=" ", strip=True)[:50000]
+        body = _first(tree.xpath("//body"))
+        if body is not None:
+            return _node_text(body)[:50000]
         return None
     except Exception as e:
-        logger.debug("BS4 extraction failed: %s", e)
+        logger.debug("lxml extraction failed: %s", e)
         return None
 
 
+def _abs_url(src: str, article_url: str) -> str:
+    """Make a protocol-relative or root-relative URL absolute against the article URL."""
+    if src.startswith("//"):
+        return "https:" + src
+    if src.startswith("/"):
+        parsed = urlparse(article_url)
+        return f"{parsed.scheme}://{parsed.netloc}{src}"
+    return src
+
+
+def _extract_image_url(tree: Any, article_url: str) -> Optional[str]:
+    """og:image, else the first image inside <article>/<main>."""
+    try:
+        src = _first(_IMAGE_XPATH(tree))
+        if src:
+            return _abs_url(str(src), article_url)
+    except Exception as e:
+        logger.debug("Image extraction failed: %s", e)
+    return None
+
+
+def _parse_article(article_url: str, html: str) -> tuple[Optional[str], Optional[str]]:
+    """Parse fetched HTML into (text, image_url). Pure CPU work, so it can run in a worker process."""
+    # One parse serves the image lookup, the <article> fast path and, if needed, the text fallback
+    # (image first: the fallback strips script/style from the tree)
+    tree = _parse_html(html)
+    image_url = _extract_image_url(tree, article_url) if tree is not None else None
+
+    # Structured pages: read <article> paragraphs straight from the tree and skip the heavy extractors
+    text = _extract_article_paragraphs(tree) if tree is not None else None
+    if not text:
+        text = _extract_with_trafilatura(article_url, html) or _extract_with_newspaper(article_url, html)
+    if not text and tree is not None:
+        text = _extract_with_lxml(tree)
+    return text, image_url
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Process pool for _parse_article, created on first use (SCRAPER_PARSE_PROCESSES > 0)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Created from a scraper thread: forking this multi-threaded process (live urllib3/ssl/logging
+            # locks) can deadlock, so workers come from a clean forkserver (spawn where it is unavailable)
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=SCRAPER_PARSE_PROCESSES, mp_context=multiprocessing.get_context(method)
+            )
+        return _parse_pool
+
+
 def scrape_article_content(article_url: str) -> tuple[Optional[str], Optional[str], str]:
     """
     Fetch full article content and image from article_url.
@@ -84,43 +246,15 @@ def scrape_article_content(article_url: str) -> tuple[Optional[str], Optional[st
     if not html:
         return None, None, content_hash(article_url)
 
-    text = _extract_with_newspaper(article_url, html)
-    if not text:
-        text = _extract_with_bs4(html)
-
-    # Extract image URL
-    image_url = None
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        # Try og:image first
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            img_url = og_image["content"]
-            if img_url.startswith("//"):
-                img_url = "https:" + img_url
-            elif img_url.startswith("/"):
-                from urllib.parse import urlparse
-                parsed = urlparse(article_url)
-                img_url = f"{parsed.scheme}://{parsed.netloc}{img_url}"
-            image_url = img_url
-        # Fallback: find first large image in article
-        if not image_url:
-            article = soup.find("article") or soup.find("main")
-            if article:
-                img = article.find("img", src=True)
-                if img:
-                    src = img.get("src") or img.get("data-src")
-                    if src:
-                        if src.startswith("//"):
-                            image_url = "https:" + src
-                        elif src.startswith("/"):
-                            from urllib.parse import urlparse
-                            parsed = urlparse(article_url)
-                            image_url = f"{parsed.scheme}://{parsed.netloc}{src}"
-                        else:
-                            image_url = src
-    except Exception as e:
-        logger.debug("Image extraction failed: %s", e)
+    if SCRAPER_PARSE_PROCESSES > 0:
+        # Fetching stays on the caller's thread; parsing runs on another core
+        try:
+            text, image_url = _get_parse_pool().submit(_parse_article, article_url, html).result()
+        except BrokenProcessPool as e:
+            logger.warning("Parse worker failed for %s, parsing in-thread: %s", article_url, e)
+            text, image_url = _parse_article(article_url, html)
+    else:
+        text, image_url = _parse_article(article_url, html)
 
     if not text or len(text) < 50:
         return None, image_url, content_hash(article_url)
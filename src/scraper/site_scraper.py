@@ -10,19 +10,28 @@ daily job can just call `collect_entries_for_sources`.
 from __future__ import annotations
 
 import logging
-from typing import Any, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from src.config import SCRAPER_DELAY_SECONDS, DEFAULT_HEADERS
 from src.scraper.bbc_scraper import scrape_bbc_section
 from src.scraper.google_news_scraper import scrape_google_news_topic
 from src.scraper.fetch_sources import fetch_feed
+from src.scraper.http import SESSION, throttle
 
 logger = logging.getLogger(__name__)
 
+# Listing scrapers only need links (with their inner headings/images); skip building the rest of the page
+_LINKS_ONLY = SoupStrainer("a", href=True)
+
+_FP_PREFIX = "https://www.fiercepharma.com"
+_ETP_PREFIX = "https://pharma.economictimes.indiatimes.com"
+# Obvious non-article FiercePharma links (nav, login, etc.); substring match anywhere in the href
+_FP_SKIP_RE = re.compile(r"/(?:search|login|about|privacy)")
+
 
 BBC_SECTION_URLS = {
     "Business": "https://www.bbc.com/news/business",
@@ -40,10 +49,11 @@ def _scrape_fiercepharma_home(section_url: str, source_name: str) -> list[dict[s
     """
     entries: list[dict[str, Any]] = []
     try:
-        resp = requests.get(section_url, headers=DEFAULT_HEADERS, timeout=20, allow_redirects=True)
+        throttle(section_url)
+        resp = SESSION.get(section_url, timeout=20, allow_redirects=True)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=_LINKS_ONLY)
 
         seen_urls: set[str] = set()
         # Look for anchor tags that point to fiercepharma articles
@@ -52,12 +62,12 @@ def _scrape_fiercepharma_home(section_url: str, source_name: str) -> list[dict[s
             if not href or href.startswith("#"):
                 continue
             if href.startswith("/"):
-                href = f"https://www.fiercepharma.com{href}"
+                href = _FP_PREFIX + href
             if "fiercepharma.com" not in href:
                 continue
 
             # Skip obvious non-article links (nav, login, etc.)
-            if any(x in href for x in ["/search", "/login", "/about", "/privacy"]):
+            if _FP_SKIP_RE.search(href):
                 continue
 
             # Title: prefer inner heading, otherwise link text
@@ -83,7 +93,7 @@ def _scrape_fiercepharma_home(section_url: str, source_name: str) -> list[dict[s
                     if src.startswith("//"):
                         image_url = "https:" + src
                     elif src.startswith("/"):
-                        image_url = "https://www.fiercepharma.com" + src
+                        image_url = _FP_PREFIX + src
                     else:
                         image_url = src
 
@@ -110,10 +120,11 @@ def _scrape_etpharma_home(section_url: str, source_name: str) -> list[dict[str,
     """
     entries: list[dict[str, Any]] = []
     try:
-        resp = requests.get(section_url, headers=DEFAULT_HEADERS, timeout=20, allow_redirects=True)
+        throttle(section_url)
+        resp = SESSION.get(section_url, timeout=20, allow_redirects=True)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=_LINKS_ONLY)
 
         seen_urls: set[str] = set()
         for link in soup.find_all("a", href=True):
@@ -124,7 +135,7 @@ def _scrape_etpharma_home(section_url: str, source_name: str) -> list[dict[str,
             if "/news/" not in href:
                 continue
             if href.startswith("/"):
-                href = f"https://pharma.economictimes.indiatimes.com{href}"
+                href = _ETP_PREFIX + href
             if "pharma.economictimes.indiatimes.com" not in href:
                 continue
 
@@ -150,7 +161,7 @@ def _scrape_etpharma_home(section_url: str, source_name: str) -> list[dict[str,
                     if src.startswith("//"):
                         image_url = "https:" + src
                     elif src.startswith("/"):
-                        image_url = "https://pharma.economictimes.indiatimes.com" + src
+                        image_url = _ETP_PREFIX + src
                     else:
                         image_url = src
 
@@ -170,14 +181,61 @@ def _scrape_etpharma_home(section_url: str, source_name: str) -> list[dict[str,
     return entries
 
 
-def _collect_for_source(src: dict[str, Any]) -> list[dict[str, Any]]:
+def _bbc_section(info: dict[str, Any]) -> list[dict[str, Any]]:
+    logger.info("Using BBC section scraper for %s (%s)", info["name"], info["category"])
+    return scrape_bbc_section(BBC_SECTION_URLS[info["category"]], info["category"])
+
+
+def _fiercepharma(info: dict[str, Any]) -> list[dict[str, Any]]:
+    section = info["base_url"] or "https://www.fiercepharma.com/"
+    logger.info("Using FiercePharma HTML scraper for %s", section)
+    return _scrape_fiercepharma_home(section, info["name"] or "Fierce Pharma")
+
+
+def _etpharma(info: dict[str, Any]) -> list[dict[str, Any]]:
+    section = info["base_url"] or "https://pharma.economictimes.indiatimes.com/"
+    logger.info("Using ET Pharma HTML scraper for %s", section)
+    return _scrape_etpharma_home(section, info["name"] or "ET Pharma")
+
+
+def _google_news(info: dict[str, Any]) -> list[dict[str, Any]]:
+    logger.info("Using Google News scraper for %s", info["name"] or info["domain"] or info["feed_url"])
+    return scrape_google_news_topic(info["feed_url"] or "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en")
+
+
+def _rss(info: dict[str, Any]) -> list[dict[str, Any]]:
+    logger.info("Using generic RSS feed for %s", info["name"] or info["feed_url"])
+    return fetch_feed(info["feed_url"], info["name"] or (info["domain"] or "Unknown"), validators=info["validators"])
+
+
+# Discovery strategy per source, first match wins: (predicate, handler) over the normalized source info
+_DISCOVERY_RULES: list[tuple[Callable[[dict[str, Any]], bool], Callable[[dict[str, Any]], list[dict[str, Any]]]]] = [
+    # 1) BBC: use dedicated HTML section scraper
+    (lambda i: i["name"].startswith("BBC") and i["category"] in BBC_SECTION_URLS, _bbc_section),
+    # 2) FiercePharma: HTML scraping of homepage/section (no RSS)
+    (lambda i: "fiercepharma.com" in i["domain"] or "fierce pharma" in i["name_lower"], _fiercepharma),
+    # 3) ET Pharma: HTML scraping of homepage/section (no RSS)
+    (lambda i: "pharma.economictimes.indiatimes.com" in i["domain"] or "et pharma" in i["name_lower"], _etpharma),
+    # 4) Google News sources: use Google News RSS → then resolve to publisher
+    (
+        lambda i: "google" in i["name_lower"]
+        or "news.google.com" in i["feed_url"].lower()
+        or "news.google.com" in i["domain"],
+        _google_news,
+    ),
+    # 5) Fallback: RSS feed if present (generic sources like Reuters, others)
+    (lambda i: bool(i["feed_url"]), _rss),
+]
+
+
+def _collect_for_source(src: dict[str, Any], conditional: bool = True) -> list[dict[str, Any]]:
     """
     Return a list of article entries for a single source.
+    With conditional, RSS feeds are fetched with the source's ETag/Last-Modified (and updated in `src`).
 
     Each entry: {title, article_url, source, published_at, optional flags}.
     """
     name = (src.get("name") or "").strip()
-    category = (src.get("category") or "").strip()
     feed_url = (src.get("feed_url") or "").strip()
     base_url = (src.get("base_url") or "").strip()
 
@@ -188,51 +246,63 @@ def _collect_for_source(src: dict[str, Any]) -> list[dict[str, Any]]:
     except Exception:
         pass
 
-    # 1) BBC: use dedicated HTML section scraper
-    if name.startswith("BBC") and category in BBC_SECTION_URLS:
-        logger.info("Using BBC section scraper for %s (%s)", name, category)
-        return scrape_bbc_section(BBC_SECTION_URLS[category], category)
-
-    # 2) FiercePharma: HTML scraping of homepage/section (no RSS)
-    if "fiercepharma.com" in domain or "fierce pharma" in name.lower():
-        section = base_url or "https://www.fiercepharma.com/"
-        logger.info("Using FiercePharma HTML scraper for %s", section)
-        return _scrape_fiercepharma_home(section, name or "Fierce Pharma")
-
-    # 3) ET Pharma: HTML scraping of homepage/section (no RSS)
-    if "pharma.economictimes.indiatimes.com" in domain or "et pharma" in name.lower():
-        section = base_url or "https://pharma.economictimes.indiatimes.com/"
-        logger.info("Using ET Pharma HTML scraper for %s", section)
-        return _scrape_etpharma_home(section, name or "ET Pharma")
-
-    # 4) Google News sources: use Google News RSS → then resolve to publisher
-    if "google" in name.lower() or "news.google.com" in feed_url.lower() or "news.google.com" in domain:
-        logger.info("Using Google News scraper for %s", name or domain or feed_url)
-        return scrape_google_news_topic(feed_url or "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en")
-
-    # 5) Fallback: RSS feed if present (generic sources like Reuters, others)
-    if feed_url:
-        logger.info("Using generic RSS feed for %s", name or feed_url)
-        return fetch_feed(feed_url, name or (domain or "Unknown"))
+    # Normalized once; every rule reads from this
+    info = {
+        "src": src,
+        "validators": src if conditional else None,
+        "name": name,
+        "name_lower": name.lower(),
+        "category": (src.get("category") or "").strip(),
+        "feed_url": feed_url,
+        "base_url": base_url,
+        "domain": domain,
+    }
+    for matches, handler in _DISCOVERY_RULES:
+        if matches(info):
+            return handler(info)
 
     logger.warning("Source %s has no discovery strategy (no feed_url/base_url); skipping", name or domain or "Unknown")
     return []
 
 
-def collect_entries_for_sources(sources: List[dict[str, Any]], limit_per_source: int = 25) -> list[dict[str, Any]]:
+def _collect_for_source_safe(src: dict[str, Any], conditional: bool = True) -> list[dict[str, Any]]:
+    """_collect_for_source, logging and swallowing errors so one bad source does not stop the rest."""
+    try:
+        return _collect_for_source(src, conditional)
+    except Exception as e:
+        logger.exception("Failed to collect entries for source %s: %s", src.get("name") or src, e)
+        return []
+
+
+def collect_entries_for_sources(
+    sources: List[dict[str, Any]], limit_per_source: int = 25, conditional: bool = True
+) -> list[dict[str, Any]]:
     """
-    Discover article entries for all active sources.
+    Discover article entries for all active sources, querying sources concurrently.
+    Entries keep source order; a URL surfaced by several sources is kept once (first source wins).
+    conditional=False ignores stored feed validators so unchanged feeds still return their entries.
     One bad source should not crash the whole job.
     """
     all_entries: list[dict[str, Any]] = []
-    for src in sources:
-        try:
-            entries = _collect_for_source(src)
+    if not sources:
+        return all_entries
+    seen: set[str] = set()
+    duplicates = 0
+    # Each source is independent, network-bound work; per-host throttling keeps same-host sources polite
+    with ThreadPoolExecutor(max_workers=min(16, len(sources))) as ex:
+        for entries in ex.map(lambda s: _collect_for_source_safe(s, conditional), sources):
             # Limit entries per source as requested
-            if entries:
-                all_entries.extend(entries[:limit_per_source])
-        except Exception as e:
-            logger.exception("Failed to collect entries for source %s: %s", src.get("name") or src, e)
-    logger.info("Total entries collected from all sources (after limits): %d", len(all_entries))
+            for entry in (entries or [])[:limit_per_source]:
+                url = entry.get("article_url")
+                if url in seen:
+                    duplicates += 1
+                    continue
+                if url:
+                    seen.add(url)
+                all_entries.append(entry)
+    logger.info(
+        "Total entries collected from all sources (after limits): %d (%d duplicate URLs dropped)",
+        len(all_entries),
+        duplicates,
+    )
     return all_entries
-